@@ -126,10 +126,18 @@ export async function POST(request: NextRequest) {
       }
 
       // Check for repeat customers by address (address is the unique identifier)
-      const allUserEntries = await OcrExport.find({ userId }).lean();
-      const matchingEntries = allUserEntries.filter((entry) =>
-        isSameAddress(entry.customerAddress, processedResult.customerAddress)
-      );
+      // Stream the user's entries instead of materialising them all at once,
+      // fetching only the fields needed for matching (skips screenshot, metadata, etc.)
+      const matchingEntries = [];
+      const userEntriesCursor = OcrExport.find({ userId })
+        .select("customerName customerAddress")
+        .lean()
+        .cursor({ batchSize: 128 });
+      for await (const entry of userEntriesCursor) {
+        if (isSameAddress(entry.customerAddress, processedResult.customerAddress)) {
+          matchingEntries.push(entry);
+        }
+      }
       const visitCount = matchingEntries.length;
       const isRepeatCustomer = visitCount > 1;
 
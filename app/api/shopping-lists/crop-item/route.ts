@@ -6,28 +6,46 @@ import ShoppingListItemCroppedImage from "@/lib/models/ShoppingListItemCroppedIm
 import connectDB from "@/lib/mongodb";
 import { handleApiError } from "@/lib/api-error-handler";
 
+// Moondream client reused across requests
+// MOONDREAM_API_KEY must be checked by the caller before the first call
+type MoondreamModel = InstanceType<typeof import("moondream")["vl"]>;
+let moondreamModel: MoondreamModel | null = null;
+
+async function getMoondreamModel(): Promise<MoondreamModel> {
+  if (!moondreamModel) {
+    // Dynamically import moondream to avoid build-time issues
+    const moondreamModule = await import("moondream");
+    const { vl } = moondreamModule;
+    moondreamModel = new vl({ apiKey: process.env.MOONDREAM_API_KEY! });
+  }
+  return moondreamModel;
+}
+
+// Server-side image decoding using jimp (pure JS, no native modules)
+async function loadImageServerSide(buffer: Buffer): Promise<any> {
+  try {
+    // Use jimp for server-side image processing (pure JS, no native dependencies)
+    const jimpModule = await import("jimp");
+    // jimp exports Jimp class as Jimp.Jimp
+    const JimpClass = (jimpModule as any).Jimp || (jimpModule as any).default?.Jimp || jimpModule;
+
+    // Load image - Jimp.read is a static method on the Jimp class
+    return await JimpClass.read(buffer);
+  } catch (error) {
+    console.error("Error loading image with jimp:", error);
+    throw new Error(`Failed to crop image: ${error instanceof Error ? error.message : "Unknown error"}`);
+  }
+}
+
 // Server-side image cropping using jimp (pure JS, no native modules)
 async function cropImageServerSide(
-  base64Image: string,
+  image: any,
   xMin: number,
   yMin: number,
   xMax: number,
   yMax: number
 ): Promise<string> {
   try {
-    // Remove data URL prefix if present
-    const base64Data = base64Image.includes(",")
-      ? base64Image.split(",")[1]
-      : base64Image;
-
-    // Use jimp for server-side image processing (pure JS, no native dependencies)
-    const jimpModule = await import("jimp");
-    // jimp exports Jimp class as Jimp.Jimp
-    const JimpClass = (jimpModule as any).Jimp || (jimpModule as any).default?.Jimp || jimpModule;
-    const buffer = Buffer.from(base64Data, "base64");
-    
-    // Load image - Jimp.read is a static method on the Jimp class
-    const image = await JimpClass.read(buffer);
     // Jimp uses width/height properties, not getWidth()/getHeight() methods
     const width = image.width || image.bitmap?.width;
     const height = image.height || image.bitmap?.height;
@@ -54,10 +72,8 @@ async function cropImageServerSide(
     });
     
     // Convert to buffer as PNG - use getBuffer() method (not getBufferAsync)
-    // JimpMime is an object with properties like .png, .jpeg, etc., or we can use the string directly
-    const JimpMime = (jimpModule as any).JimpMime;
-    const MIME_PNG = JimpMime?.png || "image/png";
-    const croppedBuffer = await croppedImage.getBuffer(MIME_PNG);
+    // getBuffer() accepts the MIME string directly (same value as JimpMime.png)
+    const croppedBuffer = await croppedImage.getBuffer("image/png");
 
     // Convert back to base64
     const croppedBase64 = `data:image/png;base64,${croppedBuffer.toString("base64")}`;
@@ -125,23 +141,20 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Initialize moondream model (dynamic import to avoid build issues)
-    const apiKey = process.env.MOONDREAM_API_KEY;
-    if (!apiKey) {
+    // Moondream API key is required for detection
+    if (!process.env.MOONDREAM_API_KEY) {
       return NextResponse.json(
         { error: "Moondream API key not configured" },
         { status: 500 }
       );
     }
 
-    // Dynamically import moondream to avoid build-time issues
-    const moondreamModule = await import("moondream");
-    const { vl } = moondreamModule;
-    const model = new vl({ apiKey: apiKey });
+    const model = await getMoondreamModel();
 
-    // Convert base64 to buffer for moondream
-    const base64Data = screenshotBase64.includes(",")
-      ? screenshotBase64.split(",")[1]
+    // Convert base64 to buffer once; shared by moondream and the crop step
+    const commaIndex = screenshotBase64.indexOf(",");
+    const base64Data = commaIndex !== -1
+      ? screenshotBase64.slice(commaIndex + 1)
       : screenshotBase64;
     const imageBuffer = Buffer.from(base64Data, "base64");
 
@@ -178,8 +191,10 @@ export async function POST(request: NextRequest) {
 
     // Crop the image using the bounding box
     // For Kroger shopping, keep full width of screenshot but use moondream's height
+    // Decode only once a detection exists (jimp decoding is synchronous pure JS)
+    const image = await loadImageServerSide(imageBuffer);
     const croppedImage = await cropImageServerSide(
-      screenshotBase64,
+      image,
       0,      // x_min: full width start
       y_min,  // y_min: from moondream
       1,      // x_max: full width end
@@ -7,6 +7,9 @@ import ShoppingList, { IShoppingListItem } from "@/lib/models/ShoppingList";
 import connectDB from "@/lib/mongodb";
 import { handleApiError } from "@/lib/api-error-handler";
 
+// Max Gemini extraction requests in flight per call
+const EXTRACTION_CONCURRENCY = 4;
+
 export async function POST(request: NextRequest) {
   try {
     const session = await getServerSession(authOptions);
@@ -32,9 +35,27 @@ export async function POST(request: NextRequest) {
     }
 
     // Extract products from all screenshots using Gemini
+    // Up to EXTRACTION_CONCURRENCY requests run at once; results keep screenshot order
+    const extractionResults: Awaited<ReturnType<typeof extractProductsFromScreenshot>>[] = [];
+    let nextIndex = 0;
+    let extractionFailed = false;
+    const worker = async () => {
+      while (!extractionFailed && nextIndex < screenshots.length) {
+        const index = nextIndex++;
+        try {
+          extractionResults[index] = await extractProductsFromScreenshot(screenshots[index]);
+        } catch (error) {
+          // Stop other workers from starting new requests
+          extractionFailed = true;
+          throw error;
+        }
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(EXTRACTION_CONCURRENCY, screenshots.length) }, worker)
+    );
     const allExtractedProducts = [];
-    for (const screenshot of screenshots) {
-      const { products: extractedProducts } = await extractProductsFromScreenshot(screenshot);
+    for (const { products: extractedProducts } of extractionResults) {
       if (extractedProducts && extractedProducts.length > 0) {
         allExtractedProducts.push(...extractedProducts);
       }
@@ -28,6 +28,11 @@ const OcrTextSchema: Schema = new Schema(
 );
 
 OcrTextSchema.index({ userId: 1, createdAt: -1 });
+// Supports polling for pending screenshots, newest first
+OcrTextSchema.index(
+  { createdAt: -1 },
+  { partialFilterExpression: { screenshot: { $exists: true } } }
+);
 
 const OcrText: Model<IOcrText> =
   mongoose.models.OcrText || mongoose.model<IOcrText>("OcrText", OcrTextSchema);
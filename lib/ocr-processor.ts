@@ -10,6 +10,10 @@ interface ParsedRow {
 
 const YAML_PROMPT = `Extract the customer information from this image. In YAML, with keys "Customer Name" and "Customer Address".`;
 
+const HEADERS: (keyof ParsedRow)[] = ["Customer Name", "Customer Address"];
+// Values that start with their own header are placeholder text
+const PLACEHOLDER_PATTERNS = HEADERS.map((header) => new RegExp(`^${header}`, "i"));
+
 function parseYamlResponse(rawText: string): { row: ParsedRow | null; error: string | null } {
   rawText = rawText.trim();
   if (!rawText) {
@@ -22,10 +26,12 @@ function parseYamlResponse(rawText: string): { row: ParsedRow | null; error: str
   // Try to extract YAML from the response (might have markdown code blocks or other text)
   let yamlText = rawText;
   
-  // Remove markdown code blocks if present
-  const yamlMatch = rawText.match(/```(?:yaml)?\s*([\s\S]*?)\s*```/) || rawText.match(/([\s\S]+)/);
-  if (yamlMatch) {
-    yamlText = yamlMatch[1].trim();
+  // Remove markdown code blocks if present (plain YAML is the common case, already trimmed)
+  if (rawText.includes("```")) {
+    const yamlMatch = rawText.match(/```(?:yaml)?\s*([\s\S]*?)\s*```/);
+    if (yamlMatch) {
+      yamlText = yamlMatch[1].trim();
+    }
   }
 
   console.log("🔍 Extracted YAML text:", yamlText);
@@ -54,11 +60,9 @@ function parseYamlResponse(rawText: string): { row: ParsedRow | null; error: str
     }
 
     // Validate that we don't have placeholder text
-    const headers = ["Customer Name", "Customer Address"];
-    for (const header of headers) {
-      const value = row[header as keyof ParsedRow].toLowerCase();
-      if (value && value.startsWith(header.toLowerCase())) {
-        return { row: null, error: `${header} still contains placeholder text` };
+    for (let i = 0; i < HEADERS.length; i++) {
+      if (PLACEHOLDER_PATTERNS[i].test(row[HEADERS[i]])) {
+        return { row: null, error: `${HEADERS[i]} still contains placeholder text` };
       }
     }
 
@@ -269,6 +269,44 @@ function getSchemaForScreenshotType(type: ScreenshotType): any {
   }
 }
 
+/**
+ * Converts a screenshot (data URL or raw base64) into Gemini inline image data.
+ * Canonical base64 is forwarded as-is; line-wrapped, URL-safe or unpadded input
+ * is normalised via a Buffer round-trip.
+ */
+function toInlineImageData(image: string): { mimeType: string; data: string } {
+  let mimeType: string = "image/png";
+  let base64Data = image;
+
+  if (image.startsWith("data:image")) {
+    const commaIndex = image.indexOf(",");
+    if (commaIndex === -1) {
+      throw new Error("Invalid screenshot data URL: missing base64 payload");
+    }
+    base64Data = image.slice(commaIndex + 1);
+
+    // Extract MIME type from data URL
+    const mimeMatch = image.match(/data:image\/([^;]+)/);
+    if (mimeMatch) {
+      const format = mimeMatch[1].toLowerCase();
+      mimeType = `image/${format === "jpg" ? "jpeg" : format}`;
+    }
+  }
+
+  const needsNormalising =
+    base64Data.length % 4 !== 0 ||
+    base64Data.includes("\n") ||
+    base64Data.includes("\r") ||
+    base64Data.includes(" ") ||
+    base64Data.includes("-") ||
+    base64Data.includes("_");
+  if (needsNormalising) {
+    base64Data = Buffer.from(base64Data, "base64").toString("base64");
+  }
+
+  return { mimeType, data: base64Data };
+}
+
 export async function processOrderScreenshotGemini(
   screenshot: string,
   ocrText?: string,
@@ -290,26 +328,8 @@ export async function processOrderScreenshotGemini(
     // The SDK reads GEMINI_API_KEY from environment, but we can also pass it explicitly
     const ai = new GoogleGenAI({ apiKey: GEMINI_API_KEY });
 
-    // Convert base64 to buffer and determine MIME type
-    let imageBuffer: Buffer;
-    let mimeType: string = "image/png";
-    
-    if (screenshot.startsWith("data:image")) {
-      const base64Data = screenshot.split(",")[1];
-      imageBuffer = Buffer.from(base64Data, "base64");
-      
-      // Extract MIME type from data URL
-      const mimeMatch = screenshot.match(/data:image\/([^;]+)/);
-      if (mimeMatch) {
-        const format = mimeMatch[1].toLowerCase();
-        mimeType = `image/${format === "jpg" ? "jpeg" : format}`;
-      }
-    } else {
-      imageBuffer = Buffer.from(screenshot, "base64");
-    }
-
-    // Convert buffer to base64 string for inline data
-    const base64ImageData = imageBuffer.toString("base64");
+    // Extract base64 payload and MIME type for inline data
+    const { mimeType, data: base64ImageData } = toInlineImageData(screenshot);
 
     // Get type-specific prompt and schema
     const prompt = getPromptForScreenshotType(screenshotType, customers);
@@ -501,26 +521,8 @@ export async function matchProductFromSearchResults(
     // Use cropped image if available, otherwise use full screenshot
     const imageToUse = croppedImage || screenshot;
 
-    // Convert base64 to buffer and determine MIME type
-    let imageBuffer: Buffer;
-    let mimeType: string = "image/png";
-    
-    if (imageToUse.startsWith("data:image")) {
-      const base64Data = imageToUse.split(",")[1];
-      imageBuffer = Buffer.from(base64Data, "base64");
-      
-      // Extract MIME type from data URL
-      const mimeMatch = imageToUse.match(/data:image\/([^;]+)/);
-      if (mimeMatch) {
-        const format = mimeMatch[1].toLowerCase();
-        mimeType = `image/${format === "jpg" ? "jpeg" : format}`;
-      }
-    } else {
-      imageBuffer = Buffer.from(imageToUse, "base64");
-    }
-
-    // Convert buffer to base64 string for inline data
-    const base64ImageData = imageBuffer.toString("base64");
+    // Extract base64 payload and MIME type for inline data
+    const { mimeType, data: base64ImageData } = toInlineImageData(imageToUse);
 
     // Format search results for the prompt
     const formattedResults = searchResults.map((product, index) => {